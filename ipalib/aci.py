@@ -19,6 +19,7 @@
 
 import shlex
 import re
+import sys
 
 import six
 
@@ -34,6 +35,16 @@ PermPat = re.compile(r'(\w+)\s*\(([^()]*)\)\s*(.*)', re.UNICODE)
 BindPat = re.compile(r'\(?([a-zA-Z0-9;\.]+)\s*(\!?=)\s*\"(.*)\"\)?',
                      re.UNICODE)
 
+# Match a single target of the usual form: (keyword operator "value").
+# Targets not matching it are handled by the slower shlex based parser.
+TargetPat = re.compile(r'[ \t\r\n]*\([ \t\r\n]*([a-zA-Z0-9_.]+)[ \t\r\n]*(!?=)'
+                       r'[ \t\r\n]*("[^"]*"|[a-zA-Z0-9_.]+|\*)[ \t\r\n]*\)')
+
+TargetEndPat = re.compile(r'[ \t\r\n]*$')
+
+# Split the value of targetattr into attribute names
+TargetAttrSplitPat = re.compile(r'[^a-zA-Z0-9;\*]+')
+
 ACTIONS = ["allow", "deny"]
 
 PERMISSIONS = ["read", "write", "add", "delete", "search", "compare",
@@ -97,9 +108,45 @@ class ACI(object):
             s = s[:-1]
         return s
 
+    def _set_target(self, var, op, val):
+        if var == 'targetattr':
+            # Make a string of the form attr || attr || ... into a list
+            t = TargetAttrSplitPat.split(val)
+            self.target[var] = {}
+            self.target[var]['operator'] = op
+            self.target[var]['expression'] = t
+        else:
+            self.target[var] = {}
+            self.target[var]['operator'] = op
+            self.target[var]['expression'] = val
+
+    def _parse_target_fast(self, aci):
+        """
+        Parse targets using TargetPat only.
+
+        Returns False without setting anything if aci contains anything
+        else than a sequence of targets of the usual form.
+        """
+        targets = []
+        pos = 0
+        match = TargetPat.match(aci, pos)
+        while match:
+            targets.append(match.groups())
+            pos = match.end()
+            match = TargetPat.match(aci, pos)
+        if not TargetEndPat.match(aci, pos):
+            return False
+
+        for var, op, val in targets:
+            self._set_target(var, op, self._remove_quotes(val))
+        return True
+
     def _parse_target(self, aci):
         if six.PY2:
             aci = aci.encode('utf-8')
+        if self._parse_target_fast(aci):
+            return
+
         lexer = shlex.shlex(aci)
         lexer.wordchars = lexer.wordchars + "."
 
@@ -122,16 +169,7 @@ class ACI(object):
                 if end != ")":
                     raise SyntaxError('No end parenthesis in target, got %s' % end)
 
-            if var == 'targetattr':
-                # Make a string of the form attr || attr || ... into a list
-                t = re.split('[^a-zA-Z0-9;\*]+', val)
-                self.target[var] = {}
-                self.target[var]['operator'] = op
-                self.target[var]['expression'] = t
-            else:
-                self.target[var] = {}
-                self.target[var]['operator'] = op
-                self.target[var]['expression'] = val
+            self._set_target(var, op, val)
 
     def _parse_acistr(self, acistr):
         vstart = acistr.find('version 3.0')
@@ -147,6 +185,10 @@ class ACI(object):
             raise SyntaxError("malformed ACI, permissions match failed %s" % acistr)
         self.action = bindperms.group(1)
         self.permissions = bindperms.group(2).replace(' ','').split(',')
+        if six.PY3:
+            # Permissions come from a small vocabulary, share the strings
+            # between all parsed ACIs
+            self.permissions = [sys.intern(p) for p in self.permissions]
         self.set_bindrule(bindperms.group(3))
 
     def validate(self):
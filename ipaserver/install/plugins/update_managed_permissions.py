@@ -318,9 +318,9 @@ class update_managed_permissions(Updater):
         base_entry = ldap.get_entry(self.api.env.basedn, ['aci'])
 
         acistrs = base_entry.get('aci', [])
-        acilist = aci._convert_strings_to_acis(acistrs)
+        _acilist, name_index = aci._convert_strings_to_acis(acistrs)
         try:
-            return aci._find_aci_by_name(acilist, aciprefix, aciname)
+            return aci._find_aci_by_name(name_index, aciprefix, aciname)
         except errors.NotFound:
             return None
 
@@ -117,7 +117,7 @@ must include all existing attributes as well. When doing an aci-mod the
 targetattr REPLACES the current attributes, it does not add to them.
 
 """
-from copy import deepcopy
+from collections import OrderedDict
 import logging
 
 import six
@@ -129,6 +129,7 @@ from ipalib.aci import ACI
 from ipalib import output
 from ipalib import _, ngettext
 from ipalib.plugable import Registry
+from ipalib.request import context
 from .baseldap import gen_pkey_only_option, pkey_to_value
 from ipapython.dn import DN
 
@@ -151,14 +152,25 @@ _type_map = {
     'dnsrecord': 'ldap:///' + str(DN(('idnsname', '*'), api.env.container_dns, api.env.basedn)),
 }
 
+# Reverse of _type_map, to find the type of an ACI target
+_type_map_targets = dict((v, k) for k, v in _type_map.items())
+
 _valid_permissions_values = [
     u'read', u'write', u'add', u'delete', u'all'
 ]
 
+_valid_permissions_set = frozenset(_valid_permissions_values)
+
 _valid_prefix_values = (
     u'permission', u'delegation', u'selfservice', u'none'
 )
 
+# Parsed ACIs keyed by the tuple of raw ACI strings they were parsed from.
+# Parsing the ACIs of the root entry is the dominant cost of every aci
+# command, so keep the last few results around.
+_PARSED_ACI_CACHE_SIZE = 8
+_parsed_aci_cache = OrderedDict()
+
 class ListOfACI(output.Output):
     type = (list, tuple)
     doc = _('A list of ACI values')
@@ -211,6 +223,58 @@ def _group_from_memberof(memberof):
     en = memberof.find(')', st)
     return memberof[st+9:en]
 
+def _set_aci_attrs(ldap, a, attrs):
+    a.set_target_attr(attrs)
+
+def _set_aci_memberof(ldap, a, memberof):
+    try:
+        api.Object['group'].get_dn_if_exists(memberof)
+    except errors.NotFound:
+        api.Object['group'].handle_not_found(memberof)
+    groupdn = _group_from_memberof(memberof)
+    a.set_target_filter('memberOf=%s' % groupdn)
+
+def _set_aci_filter(ldap, a, targetfilter):
+    # Test the filter by performing a simple search on it. The
+    # filter is considered valid if either it returns some entries
+    # or it returns no entries, otherwise we let whatever exception
+    # happened be raised.
+    if targetfilter in ('', None, u''):
+        raise errors.BadSearchFilter(info=_('empty filter'))
+    try:
+        ldap.find_entries(filter=targetfilter)
+    except errors.NotFound:
+        pass
+    a.set_target_filter(targetfilter)
+
+def _set_aci_type(ldap, a, acitype):
+    target = _type_map[acitype]
+    a.set_target(target)
+
+def _set_aci_targetgroup(ldap, a, targetgroup):
+    # Purposely no try here so we'll raise a NotFound
+    group_dn = api.Object['group'].get_dn_if_exists(targetgroup)
+    target = 'ldap:///%s' % group_dn
+    a.set_target(target)
+
+def _set_aci_subtree(ldap, a, subtree):
+    # See if the subtree is a full URI
+    target = subtree
+    if not target.startswith('ldap:///'):
+        target = 'ldap:///%s' % target
+    a.set_target(target)
+
+# Keyword arguments of _make_aci which set the ACI target, with the
+# functions which apply them, in the order they are applied.
+_aci_target_handlers = (
+    ('attrs', _set_aci_attrs),
+    ('memberof', _set_aci_memberof),
+    ('filter', _set_aci_filter),
+    ('type', _set_aci_type),
+    ('targetgroup', _set_aci_targetgroup),
+    ('subtree', _set_aci_subtree),
+)
+
 def _make_aci(ldap, current, aciname, kw):
     """
     Given a name and a set of keywords construct an ACI.
@@ -219,10 +283,7 @@ def _make_aci(ldap, current, aciname, kw):
     checked_args=['type','filter','subtree','targetgroup','attrs','memberof']
     valid={}
     for arg in checked_args:
-        if arg in kw:
-            valid[arg]=kw[arg] is not None
-        else:
-            valid[arg]=False
+        valid[arg] = kw.get(arg) is not None
 
     if valid['type'] + valid['filter'] + valid['subtree'] + valid['targetgroup'] > 1:
         raise errors.ValidationError(name='target', error=_('type, filter, subtree and targetgroup are mutually exclusive'))
@@ -238,7 +299,7 @@ def _make_aci(ldap, current, aciname, kw):
 
     group = 'group' in kw
     permission = 'permission' in kw
-    selfaci = 'selfaci' in kw and kw['selfaci'] == True
+    selfaci = kw.get('selfaci') == True
     if group + permission + selfaci > 1:
         raise errors.ValidationError(name='target', error=_('group, permission and self are mutually exclusive'))
     elif group + permission + selfaci == 0:
@@ -252,7 +313,7 @@ def _make_aci(ldap, current, aciname, kw):
         try:
             entry_attrs = api.Command['permission_show'](kw['permission'])['result']
         except errors.NotFound as e:
-            if 'test' in kw and not kw.get('test'):
+            if not kw.get('test', True):
                 raise e
             else:
                 entry_attrs = {
@@ -271,57 +332,46 @@ def _make_aci(ldap, current, aciname, kw):
         a = ACI(current)
         a.name = _make_aci_name(kw['aciprefix'], aciname)
         a.permissions = kw['permissions']
-        if 'selfaci' in kw and kw['selfaci']:
+        if kw.get('selfaci'):
             a.set_bindrule('userdn = "ldap:///self"')
         else:
             dn = entry_attrs['dn']
             a.set_bindrule('groupdn = "ldap:///%s"' % dn)
-        if valid['attrs']:
-            a.set_target_attr(kw['attrs'])
-        if valid['memberof']:
-            try:
-                api.Object['group'].get_dn_if_exists(kw['memberof'])
-            except errors.NotFound:
-                api.Object['group'].handle_not_found(kw['memberof'])
-            groupdn = _group_from_memberof(kw['memberof'])
-            a.set_target_filter('memberOf=%s' % groupdn)
-        if valid['filter']:
-            # Test the filter by performing a simple search on it. The
-            # filter is considered valid if either it returns some entries
-            # or it returns no entries, otherwise we let whatever exception
-            # happened be raised.
-            if kw['filter'] in ('', None, u''):
-                raise errors.BadSearchFilter(info=_('empty filter'))
-            try:
-                ldap.find_entries(filter=kw['filter'])
-            except errors.NotFound:
-                pass
-            a.set_target_filter(kw['filter'])
-        if valid['type']:
-            target = _type_map[kw['type']]
-            a.set_target(target)
-        if valid['targetgroup']:
-            # Purposely no try here so we'll raise a NotFound
-            group_dn = api.Object['group'].get_dn_if_exists(kw['targetgroup'])
-            target = 'ldap:///%s' % group_dn
-            a.set_target(target)
-        if valid['subtree']:
-            # See if the subtree is a full URI
-            target = kw['subtree']
-            if not target.startswith('ldap:///'):
-                target = 'ldap:///%s' % target
-            a.set_target(target)
+        for arg, handler in _aci_target_handlers:
+            value = kw.get(arg)
+            if value is not None:
+                handler(ldap, a, value)
     except SyntaxError as e:
         raise errors.ValidationError(name='target', error=_('Syntax Error: %(error)s') % dict(error=str(e)))
 
     return a
 
-def _aci_to_kw(ldap, a, test=False, pkey_only=False):
+def _get_bindrule_entry(ldap, groupdn, test=False):
+    """
+    Get the entry of the group or permission an ACI grants access to.
+    """
+    dn = DN()
+    entry = ldap.make_entry(dn)
+    try:
+        entry = ldap.get_entry(groupdn, ['cn'])
+    except errors.NotFound:
+        # FIXME, use real name here
+        if test:
+            dn = DN(('cn', 'test'), api.env.container_permission,
+                    api.env.basedn)
+            entry = ldap.make_entry(dn, {'cn': [u'test']})
+    return entry
+
+def _aci_to_kw(ldap, a, test=False, pkey_only=False, group_entries=None):
     """Convert an ACI into its equivalent keywords.
 
        This is used for the modify operation so we can merge the
        incoming kw and existing ACI and pass the result to
        _make_aci().
+
+       group_entries is an optional dict used to cache the entries of
+       the groups and permissions ACIs grant access to when converting
+       many ACIs.
     """
     kw = {}
     kw['aciprefix'], kw['aciname'] = _parse_aci_name(a.name)
@@ -341,13 +391,9 @@ def _aci_to_kw(ldap, a, test=False, pkey_only=False):
             kw['filter'] = unicode(target)
     if 'target' in a.target:
         target = a.target['target']['expression']
-        found = False
-        for k, value in _type_map.items():
-            if value == target:
-                kw['type'] = unicode(k)
-                found = True
-                break
-        if not found:
+        if target in _type_map_targets:
+            kw['type'] = unicode(_type_map_targets[target])
+        else:
             if target.startswith('('):
                 kw['filter'] = unicode(target)
             else:
@@ -372,16 +418,12 @@ def _aci_to_kw(ldap, a, test=False, pkey_only=False):
     else:
         groupdn = DN(groupdn)
         if len(groupdn) and groupdn[0].attr == 'cn':
-            dn = DN()
-            entry = ldap.make_entry(dn)
-            try:
-                entry = ldap.get_entry(groupdn, ['cn'])
-            except errors.NotFound as e:
-                # FIXME, use real name here
-                if test:
-                    dn = DN(('cn', 'test'), api.env.container_permission,
-                            api.env.basedn)
-                    entry = ldap.make_entry(dn, {'cn': [u'test']})
+            if group_entries is not None and groupdn in group_entries:
+                entry = group_entries[groupdn]
+            else:
+                entry = _get_bindrule_entry(ldap, groupdn, test)
+                if group_entries is not None:
+                    group_entries[groupdn] = entry
             if api.env.container_permission in entry.dn:
                 kw['permission'] = entry['cn'][0]
             else:
@@ -390,35 +432,124 @@ def _aci_to_kw(ldap, a, test=False, pkey_only=False):
 
     return kw
 
+def _looks_like_aci(acistr):
+    """
+    Cheap check ruling out strings which ACI() would fail to parse.
+    """
+    return '(version 3.0' in acistr
+
+def _parse_acis_tuple(acistrs):
+    """
+    Parse a tuple of ACI strings.
+
+    Returns a tuple of ACI objects and a dict mapping the lowercased ACI
+    names to ACI objects. The result is cached, the returned objects are
+    shared and must not be modified.
+    """
+    parsed = _parsed_aci_cache.get(acistrs)
+    if parsed is None:
+        acis = []
+        name_index = {}
+        for a in acistrs:
+            aci = None
+            if _looks_like_aci(a):
+                try:
+                    aci = ACI(a)
+                except SyntaxError:
+                    pass
+            if aci is None:
+                logger.warning("Failed to parse: %s", a)
+                continue
+            acis.append(aci)
+            name_index.setdefault(aci.name.lower(), aci)
+        parsed = (tuple(acis), name_index)
+        if len(_parsed_aci_cache) >= _PARSED_ACI_CACHE_SIZE:
+            _parsed_aci_cache.popitem(last=False)
+        _parsed_aci_cache[acistrs] = parsed
+    return parsed
+
+def _clear_parsed_aci_cache():
+    _parsed_aci_cache.clear()
+
 def _convert_strings_to_acis(acistrs):
-    acis = []
-    for a in acistrs:
-        try:
-            acis.append(ACI(a))
-        except SyntaxError:
-            logger.warning("Failed to parse: %s", a)
-    return acis
+    """
+    Convert a list of ACI strings to a list of ACI objects and an index
+    of the ACI objects by lowercased name.
+    """
+    acis, name_index = _parse_acis_tuple(tuple(acistrs))
+    return list(acis), name_index
 
-def _find_aci_by_name(acis, aciprefix, aciname):
+def _find_aci_by_name(name_index, aciprefix, aciname):
     name = _make_aci_name(aciprefix, aciname).lower()
+    try:
+        return name_index[name]
+    except KeyError:
+        raise errors.NotFound(
+            reason=_('ACI with name "%s" not found') % aciname)
+
+
+def _get_aci_entry(ldap):
+    """
+    Get the root entry with its ACIs.
+
+    The entry is cached for the rest of the request and must not be
+    modified, commands which modify the ACIs should read the entry
+    with ldap.get_entry() instead.
+    """
+    try:
+        entry = getattr(context, 'aci_entry')
+        if entry.conn.conn is ldap.conn:
+            return entry
+    except AttributeError:
+        # Not in our context yet
+        pass
+    entry = ldap.get_entry(api.env.basedn, ['aci'])
+    context.aci_entry = entry
+    return entry
+
+def _clear_aci_entry_cache():
+    """
+    Drop the root entry cached by _get_aci_entry() after an ACI update.
+    """
+    if hasattr(context, 'aci_entry'):
+        delattr(context, 'aci_entry')
+
+def _check_duplicate_aci(acistrs, newaci, newaci_str, skip=None):
+    """
+    Raise DuplicateEntry if newaci duplicates one of the ACIs in acistrs.
+
+    :param skip: the string of an ACI in acistrs which is being replaced
+                 by newaci
+    """
+    # ACI strings are serialized canonically, an identical string is
+    # a duplicate and there is no need to compare the parsed ACIs.
+    if newaci_str in acistrs:
+        raise errors.DuplicateEntry()
+
+    # Only ACIs with the same name (ignoring case) can be duplicates,
+    # compare with them only.
+    acis, name_index = _convert_strings_to_acis(acistrs)
+    newaci_name = newaci.name.lower()
+    if newaci_name not in name_index:
+        return
     for a in acis:
-        if a.name.lower() == name:
-            return a
-    raise errors.NotFound(reason=_('ACI with name "%s" not found') % aciname)
+        if a.orig_acistr == skip or a.name.lower() != newaci_name:
+            continue
+        # FIXME: add check for permission_group = permission_group
+        if a.isequal(newaci) or newaci.name == a.name:
+            raise errors.DuplicateEntry()
 
 
 def validate_permissions(ugettext, perm):
     perm = perm.strip().lower()
-    if perm not in _valid_permissions_values:
+    if perm not in _valid_permissions_set:
         return '"%s" is not a valid permission' % perm
 
 
 def _normalize_permissions(perm):
-    valid_permissions = []
-    perm = perm.strip().lower()
-    if perm not in valid_permissions:
-        valid_permissions.append(perm)
-    return ','.join(valid_permissions)
+    # This normalizes a single value of a multivalue parameter. Values
+    # are not split on commas, validate_permissions rejects them.
+    return perm.strip().lower()
 
 _prefix_option = StrEnum('aciprefix',
                 cli_name='prefix',
@@ -548,18 +679,17 @@ class aci_add(crud.Create):
         newaci = _make_aci(ldap, None, aciname, kw)
 
         entry = ldap.get_entry(self.api.env.basedn, ['aci'])
-
-        acis = _convert_strings_to_acis(entry.get('aci', []))
-        for a in acis:
-            # FIXME: add check for permission_group = permission_group
-            if a.isequal(newaci) or newaci.name == a.name:
-                raise errors.DuplicateEntry()
+        acistrs = entry.setdefault('aci', [])
 
         newaci_str = unicode(newaci)
-        entry.setdefault('aci', []).append(newaci_str)
+        _check_duplicate_aci(acistrs, newaci, newaci_str)
+
+        acistrs.append(newaci_str)
 
         if not kw.get('test', False):
             ldap.update_entry(entry)
+            _clear_parsed_aci_cache()
+            _clear_aci_entry_cache()
 
         if kw.get('raw', False):
             result = dict(aci=unicode(newaci_str))
@@ -594,17 +724,16 @@ class aci_del(crud.Delete):
         entry = ldap.get_entry(self.api.env.basedn, ['aci'])
 
         acistrs = entry.get('aci', [])
-        acis = _convert_strings_to_acis(acistrs)
-        aci = _find_aci_by_name(acis, aciprefix, aciname)
-        for a in acistrs:
-            candidate = ACI(a)
-            if aci.isequal(candidate):
-                acistrs.remove(a)
-                break
+        _acis, name_index = _convert_strings_to_acis(acistrs)
+        aci = _find_aci_by_name(name_index, aciprefix, aciname)
+        # The ACI was parsed from one of acistrs, remove that very string
+        acistrs.remove(aci.orig_acistr)
 
         entry['aci'] = acistrs
 
         ldap.update_entry(entry)
+        _clear_parsed_aci_cache()
+        _clear_aci_entry_cache()
 
         return dict(
             result=True,
@@ -631,39 +760,36 @@ class aci_mod(crud.Update):
 
         entry = ldap.get_entry(self.api.env.basedn, ['aci'])
 
-        acis = _convert_strings_to_acis(entry.get('aci', []))
-        aci = _find_aci_by_name(acis, aciprefix, aciname)
+        acistrs = entry.get('aci', [])
+        _acis, name_index = _convert_strings_to_acis(acistrs)
+        aci = _find_aci_by_name(name_index, aciprefix, aciname)
 
         # The strategy here is to convert the ACI we're updating back into
         # a series of keywords. Then we replace any keywords that have been
         # updated and convert that back into an ACI and write it out.
-        oldkw = _aci_to_kw(ldap, aci)
-        newkw = deepcopy(oldkw)
+        newkw = _aci_to_kw(ldap, aci)
         if newkw.get('selfaci', False):
             # selfaci is set in aci_to_kw to True only if the target is self
             kw['selfaci'] = True
         newkw.update(kw)
-        for acikw in (oldkw, newkw):
-            acikw.pop('aciname', None)
+        newkw.pop('aciname', None)
 
         # _make_aci is what is run in aci_add and validates the input.
-        # Do this before we delete the existing ACI.
         newaci = _make_aci(ldap, None, aciname, newkw)
         if aci.isequal(newaci):
             raise errors.EmptyModlist()
 
-        self.api.Command['aci_del'](aciname, aciprefix=aciprefix)
+        # Replace the old ACI string with the new one and write the entry
+        # once, the ACI is never missing from LDAP in between.
+        newaci_str = unicode(newaci)
+        _check_duplicate_aci(acistrs, newaci, newaci_str,
+                             skip=aci.orig_acistr)
+        acistrs[acistrs.index(aci.orig_acistr)] = newaci_str
+        entry['aci'] = acistrs
 
-        try:
-            result = self.api.Command['aci_add'](aciname, **newkw)['result']
-        except Exception as e:
-            # ACI could not be added, try to restore the old deleted ACI and
-            # report the ADD error back to user
-            try:
-                self.api.Command['aci_add'](aciname, **oldkw)
-            except Exception:
-                pass
-            raise e
+        ldap.update_entry(entry)
+        _clear_parsed_aci_cache()
+        _clear_aci_entry_cache()
 
         if kw.get('raw', False):
             result = dict(aci=unicode(newaci))
@@ -705,68 +831,65 @@ class aci_find(crud.Search):
     def execute(self, term=None, **kw):
         ldap = self.api.Backend.ldap2
 
-        entry = ldap.get_entry(self.api.env.basedn, ['aci'])
+        entry = _get_aci_entry(ldap)
 
-        acis = _convert_strings_to_acis(entry.get('aci', []))
-        results = []
+        acis, _name_index = _convert_strings_to_acis(entry.get('aci', []))
 
         if term:
             term = term.lower()
+            results = []
+            # ACIs found so far by lowercased name, only ACIs with the same
+            # name can be equal
+            found = {}
             for a in acis:
-                if a.name.lower().find(term) != -1 and a not in results:
+                name = a.name.lower()
+                if term not in name:
+                    continue
+                same_name = found.setdefault(name, [])
+                if a not in same_name:
+                    same_name.append(a)
                     results.append(a)
-            acis = list(results)
-        else:
-            results = list(acis)
+            acis = results
+
+        # Resolve the search criteria once and then check every ACI
+        # against all of them in a single pass.
+        matchers = []
 
         if kw.get('aciname'):
-            for a in acis:
-                prefix, name = _parse_aci_name(a.name)
-                if name != kw['aciname']:
-                    results.remove(a)
-            acis = list(results)
+            aciname = kw['aciname']
+            matchers.append(
+                lambda a: _parse_aci_name(a.name)[1] == aciname)
 
         if kw.get('aciprefix'):
-            for a in acis:
-                prefix, name = _parse_aci_name(a.name)
-                if prefix != kw['aciprefix']:
-                    results.remove(a)
-            acis = list(results)
+            aciprefix = kw['aciprefix']
+            matchers.append(
+                lambda a: _parse_aci_name(a.name)[0] == aciprefix)
 
         if kw.get('attrs'):
-            for a in acis:
-                if not 'targetattr' in a.target:
-                    results.remove(a)
-                    continue
-                alist1 = sorted(
-                    [t.lower() for t in a.target['targetattr']['expression']]
-                )
-                alist2 = sorted([t.lower() for t in kw['attrs']])
-                if len(set(alist1) & set(alist2)) != len(alist2):
-                    results.remove(a)
-            acis = list(results)
+            want_attrs = frozenset(t.lower() for t in kw['attrs'])
+
+            def match_attrs(a):
+                if 'targetattr' not in a.target:
+                    return False
+                return want_attrs.issubset(
+                    t.lower() for t in a.target['targetattr']['expression'])
+            matchers.append(match_attrs)
 
         if kw.get('permission'):
             try:
-                self.api.Command['permission_show'](
+                permission = self.api.Command['permission_show'](
                     kw['permission']
-                )
+                )['result']
             except errors.NotFound:
                 pass
             else:
-                for a in acis:
-                    uri = 'ldap:///%s' % entry.dn
-                    if a.bindrule['expression'] != uri:
-                        results.remove(a)
-                acis = list(results)
+                permission_uri = 'ldap:///%s' % permission['dn']
+                matchers.append(
+                    lambda a: a.bindrule['expression'] == permission_uri)
 
         if kw.get('permissions'):
-            for a in acis:
-                alist1 = sorted(a.permissions)
-                alist2 = sorted(kw['permissions'])
-                if len(set(alist1) & set(alist2)) != len(alist2):
-                    results.remove(a)
-            acis = list(results)
+            want_perms = frozenset(kw['permissions'])
+            matchers.append(lambda a: want_perms.issubset(a.permissions))
 
         if kw.get('memberof'):
             try:
@@ -775,103 +898,82 @@ class aci_find(crud.Search):
                 pass
             else:
                 memberof_filter = '(memberOf=%s)' % dn
-                for a in acis:
-                    if 'targetfilter' in a.target:
-                        targetfilter = a.target['targetfilter']['expression']
-                        if targetfilter != memberof_filter:
-                            results.remove(a)
-                    else:
-                        results.remove(a)
+                matchers.append(
+                    lambda a: ('targetfilter' in a.target and
+                               a.target['targetfilter']['expression'] ==
+                               memberof_filter))
 
         if kw.get('type'):
-            for a in acis:
-                if 'target' in a.target:
-                    target = a.target['target']['expression']
-                else:
-                    results.remove(a)
-                    continue
-                found = False
-                for k, value in _type_map.items():
-                    if value == target and kw['type'] == k:
-                        found = True
-                        break
-                if not found:
-                    try:
-                        results.remove(a)
-                    except ValueError:
-                        pass
+            type_target = _type_map[kw['type']]
+            matchers.append(
+                lambda a: ('target' in a.target and
+                           a.target['target']['expression'] == type_target))
 
         if kw.get('selfaci', False) is True:
-            for a in acis:
-                if a.bindrule['expression'] != u'ldap:///self':
-                    try:
-                        results.remove(a)
-                    except ValueError:
-                        pass
+            matchers.append(
+                lambda a: a.bindrule['expression'] == u'ldap:///self')
 
         if kw.get('group'):
-            for a in acis:
+            group = kw['group']
+
+            def match_group(a):
                 groupdn = a.bindrule['expression']
                 groupdn = DN(groupdn.replace('ldap:///',''))
                 try:
                     cn = groupdn[0]['cn']
                 except (IndexError, KeyError):
                     cn = None
-                if cn is None or cn != kw['group']:
-                    try:
-                        results.remove(a)
-                    except ValueError:
-                        pass
+                return cn is not None and cn == group
+            matchers.append(match_group)
 
         if kw.get('targetgroup'):
-            for a in acis:
-                found = False
-                if 'target' in a.target:
-                    target = a.target['target']['expression']
-                    targetdn = DN(target.replace('ldap:///',''))
-                    group_container_dn = DN(api.env.container_group, api.env.basedn)
-                    if targetdn.endswith(group_container_dn):
-                        try:
-                            cn = targetdn[0]['cn']
-                        except (IndexError, KeyError):
-                            cn = None
-                        if cn == kw['targetgroup']:
-                            found = True
-                if not found:
-                    try:
-                        results.remove(a)
-                    except ValueError:
-                        pass
+            targetgroup = kw['targetgroup']
+            group_container_dn = DN(api.env.container_group, api.env.basedn)
+
+            def match_targetgroup(a):
+                if 'target' not in a.target:
+                    return False
+                target = a.target['target']['expression']
+                targetdn = DN(target.replace('ldap:///',''))
+                if not targetdn.endswith(group_container_dn):
+                    return False
+                try:
+                    cn = targetdn[0]['cn']
+                except (IndexError, KeyError):
+                    cn = None
+                return cn == targetgroup
+            matchers.append(match_targetgroup)
 
         if kw.get('filter'):
             if not kw['filter'].startswith('('):
                 kw['filter'] = unicode('('+kw['filter']+')')
-            for a in acis:
-                if 'targetfilter' not in a.target or\
-                    not a.target['targetfilter']['expression'] or\
-                    a.target['targetfilter']['expression'] != kw['filter']:
-                    results.remove(a)
+            targetfilter = kw['filter']
+            matchers.append(
+                lambda a: ('targetfilter' in a.target and
+                           a.target['targetfilter']['expression'] ==
+                           targetfilter))
 
         if kw.get('subtree'):
-            for a in acis:
-                if 'target' in a.target:
-                    target = a.target['target']['expression']
-                else:
-                    results.remove(a)
-                    continue
-                if kw['subtree'].lower() != target.lower():
-                    try:
-                        results.remove(a)
-                    except ValueError:
-                        pass
-
+            subtree = kw['subtree'].lower()
+            matchers.append(
+                lambda a: ('target' in a.target and
+                           a.target['target']['expression'].lower() ==
+                           subtree))
+
+        # Matching ACIs are converted as they are found, only the
+        # requested form of each result is built.
+        results = (a for a in acis if all(m(a) for m in matchers))
+
+        raw = kw.get('raw', False)
+        pkey_only = kw.get('pkey_only', False)
         acis = []
+        group_entries = {}
         for result in results:
-            if kw.get('raw', False):
+            if raw:
                 aci = dict(aci=unicode(result))
             else:
-                aci = _aci_to_kw(ldap, result,
-                        pkey_only=kw.get('pkey_only', False))
+                aci = _aci_to_kw(ldap, result, pkey_only=pkey_only,
+                                 group_entries=group_entries)
             acis.append(aci)
 
         return dict(
@@ -907,11 +1009,14 @@ class aci_show(crud.Retrieve):
         ldap = self.api.Backend.ldap2
 
         dn = kw.get('location', self.api.env.basedn)
-        entry = ldap.get_entry(dn, ['aci'])
+        if dn == self.api.env.basedn:
+            entry = _get_aci_entry(ldap)
+        else:
+            entry = ldap.get_entry(dn, ['aci'])
 
-        acis = _convert_strings_to_acis(entry.get('aci', []))
+        _acis, name_index = _convert_strings_to_acis(entry.get('aci', []))
 
-        aci = _find_aci_by_name(acis, kw['aciprefix'], aciname)
+        aci = _find_aci_by_name(name_index, kw['aciprefix'], aciname)
         if kw.get('raw', False):
             result = dict(aci=unicode(aci))
         else:
@@ -943,8 +1048,8 @@ class aci_rename(crud.Update):
 
         entry = ldap.get_entry(self.api.env.basedn, ['aci'])
 
-        acis = _convert_strings_to_acis(entry.get('aci', []))
-        aci = _find_aci_by_name(acis, kw['aciprefix'], aciname)
+        acis, name_index = _convert_strings_to_acis(entry.get('aci', []))
+        aci = _find_aci_by_name(name_index, kw['aciprefix'], aciname)
 
         for a in acis:
             prefix, _name = _parse_aci_name(a.name)
@@ -24,6 +24,7 @@ import traceback
 import six
 
 from . import baseldap
+from .aci import _clear_aci_entry_cache
 from .privilege import validate_permission_to_privilege
 from ipalib import errors
 from ipalib.parameters import Str, StrEnum, DNParam, Flag
@@ -620,6 +621,7 @@ class permission(baseldap.LDAPObject):
             raise errors.NotFound(reason=_('Entry %s not found') % location)
         entry.setdefault('aci', []).append(acistring)
         ldap.update_entry(entry)
+        _clear_aci_entry_cache()
 
     def remove_aci(self, permission_entry):
         """Remove the ACI corresponding to the given permission entry
@@ -666,6 +668,8 @@ class permission(baseldap.LDAPObject):
             ldap.update_entry(acientry)
         except errors.EmptyModlist:
             logger.debug('No changes to ACI')
+        else:
+            _clear_aci_entry_cache()
         return acientry, acistring
 
     def _get_aci_entry_and_string(self, permission_entry, name=None,
@@ -4349,3 +4349,82 @@ class test_autoadd_operational_attrs(Declarative):
             'allow (read) groupdn = "ldap:///%s";)' % permission1_dn,
         ),
     ]
+
+
+@pytest.mark.tier1
+class test_permission_aci_find(Declarative):
+    """Test searching the ACIs of permissions with aci_find"""
+    cleanup_commands = [
+        ('permission_del', [permission1], {'force': True}),
+    ]
+
+    tests = [
+        dict(
+            desc='Create targetgroup permission %r' % permission1,
+            command=(
+                'permission_add', [permission1], dict(
+                    targetgroup=u'editors',
+                    ipapermright=u'write',
+                    attrs=[u'sn'],
+                )
+            ),
+            expected=dict(
+                value=permission1,
+                summary=u'Added permission "%s"' % permission1,
+                result=dict(
+                    dn=permission1_dn,
+                    cn=[permission1],
+                    objectclass=objectclasses.permission,
+                    targetgroup=[u'editors'],
+                    ipapermright=[u'write'],
+                    attrs=[u'sn'],
+                    ipapermbindruletype=[u'permission'],
+                    ipapermtarget=[DN(('cn', 'editors'), groups_dn)],
+                    ipapermissiontype=[u'SYSTEM', u'V2'],
+                    ipapermlocation=[api.env.basedn],
+                ),
+            ),
+        ),
+
+        dict(
+            desc='Search for ACIs of permission %r' % permission1,
+            command=(
+                'aci_find', [], dict(
+                    permission=permission1,
+                    aciprefix=u'permission',
+                    raw=True,
+                )
+            ),
+            expected=dict(
+                count=1,
+                truncated=False,
+                summary=u'1 ACI matched',
+                result=[
+                    dict(aci=(
+                        u'(target = "ldap:///%s")' %
+                            DN('cn=editors', groups_dn) +
+                        u'(targetattr = "sn")' +
+                        u'(version 3.0;acl "permission:%s";' % permission1 +
+                        u'allow (write) groupdn = "ldap:///%s";)' %
+                            permission1_dn)),
+                ],
+            ),
+        ),
+
+        dict(
+            desc='Search for ACIs by memberof and a non-matching filter',
+            command=(
+                'aci_find', [], dict(
+                    memberof=u'admins',
+                    filter=u'(cn=%s)' % permission1,
+                    aciprefix=u'permission',
+                )
+            ),
+            expected=dict(
+                count=0,
+                truncated=False,
+                summary=u'0 ACIs matched',
+                result=[],
+            ),
+        ),
+    ]